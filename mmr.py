@@ -24,6 +24,10 @@ DESCRIPTION:
 
 USAGE:
    mmr.py --directory '<full path to directory>' [--recursive]
+   mmr.py --archive '<full path to zip or tar backup>' [--output '<full path to output directory>']
+
+   In archive mode, members are read straight out of the archive as if they were files in camera tag
+   directories and each media file is written once, under its new name, into the output directory.
 
 ---------------------------
 """
@@ -33,6 +37,13 @@ import sys
 import os
 import datetime
 import re
+import io
+import posixpath
+import shutil
+import struct
+import tarfile
+import tempfile
+import zipfile
 
 import exiftool
 
@@ -43,6 +54,8 @@ class ArgsManager:
     parser = None
     args = None
     directory = ''
+    archive = ''
+    output = ''
     is_recursive = False
 
     @staticmethod
@@ -50,8 +63,13 @@ class ArgsManager:
         parser = argparse.ArgumentParser(__file__,
                                          description='A script to rename video files in the format YYYY_MMDD_HHMMSS_####',
                                          formatter_class=argparse.RawTextHelpFormatter)
-        parser.add_argument('--directory', dest='directory', action='store', metavar='<path to video files',
-                            help='Full path to directory with video files to rename.', required=True)
+        source_group = parser.add_mutually_exclusive_group(required=True)
+        source_group.add_argument('--directory', dest='directory', action='store', metavar='<path to video files',
+                                  help='Full path to directory with video files to rename.')
+        source_group.add_argument('--archive', dest='archive', action='store', metavar='<path to zip or tar file>',
+                                  help='Full path to a ZIP or TAR backup to rename files out of without extracting it.')
+        parser.add_argument('--output', dest='output', action='store', metavar='<path to output directory>',
+                            help='Directory to write renamed archive files to (default: the archive\'s directory).')
         return parser
 
     @staticmethod
@@ -60,6 +78,11 @@ class ArgsManager:
             ArgsManager.parser = ArgsManager.setup_parser()
         if ArgsManager.args is None:
             ArgsManager.args = ArgsManager.parser.parse_args()
+        if ArgsManager.args.archive is not None:
+            ArgsManager.parse_archive_args()
+            return
+        if ArgsManager.args.output is not None:
+            ArgsManager.parser.error('--output can only be used with --archive')
         ArgsManager.directory = ArgsManager.args.directory
         print('--directory: ' + ArgsManager.directory)
         print()
@@ -67,6 +90,22 @@ class ArgsManager:
             print('Path does not exist: ' + ArgsManager.directory)
             sys.exit()
 
+    @staticmethod
+    def parse_archive_args():
+        ArgsManager.archive = ArgsManager.args.archive
+        ArgsManager.output = ArgsManager.args.output
+        if ArgsManager.output is None:
+            ArgsManager.output = os.path.dirname(os.path.abspath(ArgsManager.archive))
+        print('--archive: ' + ArgsManager.archive)
+        print('--output: ' + ArgsManager.output)
+        print()
+        if not os.path.isfile(ArgsManager.archive):
+            print('Path does not exist: ' + ArgsManager.archive)
+            sys.exit()
+        if not zipfile.is_zipfile(ArgsManager.archive) and not tarfile.is_tarfile(ArgsManager.archive):
+            print('Not a ZIP or TAR archive: ' + ArgsManager.archive)
+            sys.exit()
+
 
 class MyMediaRenamerBase:
     photo_ext_list = ['nef', 'jpg', 'jpeg', 'mpo', 'png']
@@ -75,6 +114,8 @@ class MyMediaRenamerBase:
     all_ext_list = photo_ext_list + video_ext_list + delete_ext_list
 
     unknown_list = 'UNKNOWN LIST-'
+    archive_skipped_list_label = 'ARCHIVE SKIPPED LIST-'
+    archive_unsafe_path_list_label = 'ARCHIVE UNSAFE PATH LIST-'
     previous_rename_new_date_not_found_list_label = 'PREVIOUS RENAME, NEW DATE NOT FOUND LIST'
     previous_rename_new_name_list_label = 'PREVIOUS RENAME, NEW NAME LIST'
     previous_rename_new_date_list_label = 'PREVIOUS RENAME, NEW DATE LIST'
@@ -87,6 +128,8 @@ class MyMediaRenamerBase:
 
     category_list = []
     category_list.append(unknown_list)
+    category_list.append(archive_skipped_list_label)
+    category_list.append(archive_unsafe_path_list_label)
     category_list.append(previous_rename_new_date_not_found_list_label)
     category_list.append(previous_rename_new_name_list_label)
     category_list.append(previous_rename_new_date_list_label)
@@ -118,11 +161,12 @@ class MediaType:
 
 class FileObject(MyMediaRenamerBase):
     def __init__(self, root, file_name, camera_tag):
-        self.file_path = os.path.join((root + '\\' + file_name).replace('\\\\', '\\'))
+        self.file_path = os.path.join(root, file_name)
         self.root_path = os.path.dirname(self.file_path)
         self.file_name = os.path.basename(self.file_path)
         self.file_name_parts = self.get_file_name_parts()
         self.is_media = False
+        self.is_marked_for_delete = False
         self.new_file_name_object = None
         self.media_type = MediaType()
         if self.file_name_parts is not None:
@@ -156,6 +200,12 @@ class FileObject(MyMediaRenamerBase):
     def get_new_file_path(self):
         return os.path.join(self.root_path, self.new_file_name)
 
+    def get_exif_file_path(self):
+        return self.file_path
+
+    def get_modified_timestamp(self):
+        return os.path.getmtime(self.file_path)
+
     def rename(self):
         if self.file_path != '' and self.root_path != '' and self.new_file_name != '':
             new_file_path = self.get_new_file_path()
@@ -166,6 +216,57 @@ class FileObject(MyMediaRenamerBase):
                 print('     {0} to {1}'.format(self.file_path, new_file_path))
                 print()
                 print(str(e))
+                return False
+        return True
+
+
+class ArchiveFileObject(FileObject):
+    # formats whose EXIF APP1 segment sits right at the start of the file, within header_size bytes
+    header_ext_list = ['jpg', 'jpeg', 'mpo']
+    header_size = 128 * 1024
+    # TIFF based raw formats
+    tiff_ext_list = ['nef']
+    copy_buffer_size = 1024 * 1024
+
+    def __init__(self, am, member, member_index, member_path, camera_tag):
+        member_dir, file_name = posixpath.split(member_path)
+        super().__init__(os.path.join(am.output_directory, *member_dir.split('/')), file_name, camera_tag)
+        self.archive_manager = am
+        self.member = member
+        self.member_index = member_index
+
+    def get_exif_file_path(self):
+        # hand exiftool only the bytes of the member that hold the date tag
+        if self.ext in self.tiff_ext_list:
+            return self.archive_manager.write_tiff_header(self.member, self.ext)
+        if self.ext == 'png':
+            return self.archive_manager.write_png_header(self.member, self.ext)
+        if self.media_type.is_video:
+            return self.archive_manager.write_quicktime_header(self.member, self.ext)
+        return self.archive_manager.write_header(self.member, self.ext, self.header_size)
+
+    def get_modified_timestamp(self):
+        return self.archive_manager.get_member_timestamp(self.member)
+
+    def rename(self):
+        # extract the member straight to its new name
+        if self.new_file_name == '':
+            return True
+        new_file_path = self.get_new_file_path()
+        try:
+            os.makedirs(self.root_path, exist_ok=True)
+            with self.archive_manager.open_member(self.member) as src, open(new_file_path, 'xb') as dst:
+                shutil.copyfileobj(src, dst, self.copy_buffer_size)
+            timestamp = self.get_modified_timestamp()
+            if timestamp is not None:
+                os.utime(new_file_path, (timestamp, timestamp))
+        except Exception as e:
+            print('Extract failed:')
+            print('     {0} to {1}'.format(self.file_name, new_file_path))
+            print()
+            print(str(e))
+            return False
+        return True
 
 
 class FileNameObject:
@@ -186,6 +287,9 @@ class FileManager(MyMediaRenamerBase):
         self.category_list_dict = dict((category, []) for category in self.category_list)
         self.count = 0
         self.total_files = 0
+        # (root path, new file name) for every new file name handed out so far
+        self.taken_file_names = set()
+        self.dir_file_names_dict = {}
 
     @staticmethod
     def get_date_time_name_from_file_object(fo: FileObject):
@@ -201,24 +305,25 @@ class FileManager(MyMediaRenamerBase):
 
     def set_new_file_name(self, fo: FileObject, new_file_name):
         fo.new_file_name = new_file_name
-        dir_file_names = [fn for fn in os.listdir(fo.root_path) if os.path.isfile(os.path.join(fo.root_path, fn))]
+        dir_file_names = self.get_dir_file_names(fo.root_path)
         count = 0
         original_file_name = fo.new_file_name
         while self.file_exists(fo, dir_file_names):
             count += 1
             new_file_name_parts = os.path.splitext(os.path.basename(original_file_name))
             fo.new_file_name = '{0}_{1}{2}'.format(new_file_name_parts[0], count, new_file_name_parts[1])
+        self.taken_file_names.add((fo.root_path, fo.new_file_name))
 
-    def file_exists(self, fo: FileObject, this_directory_file_names):
-
-        duplicate_existing_file_name_list = [fn for fn in this_directory_file_names
-                                             if fn == fo.new_file_name]
+    def get_dir_file_names(self, root_path):
+        # nothing is renamed until every file is processed, so each directory is only listed once
+        if root_path not in self.dir_file_names_dict:
+            self.dir_file_names_dict[root_path] = set(
+                fn for fn in os.listdir(root_path) if os.path.isfile(os.path.join(root_path, fn))) \
+                if os.path.isdir(root_path) else set()
+        return self.dir_file_names_dict[root_path]
 
-        duplicate_renamed_file_name_list = [this_fo.new_file_name
-                                            for category in self.renamable_category_list
-                                            for this_fo in self.category_list_dict[category]
-                                            if this_fo.root_path == fo.root_path and this_fo.new_file_name == fo.new_file_name]
-        return True if len(duplicate_existing_file_name_list) > 0 or len(duplicate_renamed_file_name_list) > 0 else False
+    def file_exists(self, fo: FileObject, this_directory_file_names):
+        return fo.new_file_name in this_directory_file_names or (fo.root_path, fo.new_file_name) in self.taken_file_names
 
     @staticmethod
     def convert_to_datetime(date_name):
@@ -229,11 +334,13 @@ class FileManager(MyMediaRenamerBase):
 
     @staticmethod
     def get_datetime_from_modified_date(fo: FileObject):
-        timestamp = os.path.getmtime(fo.file_path)
+        timestamp = fo.get_modified_timestamp()
+        if timestamp is None:
+            return None
         try:
             return datetime.datetime.fromtimestamp(timestamp)
-        except ValueError:
-            return False
+        except (ValueError, OverflowError, OSError):
+            return None
 
     @staticmethod
     def get_date_time_name_from_datetime(dt: datetime):
@@ -259,7 +366,7 @@ class FileManager(MyMediaRenamerBase):
             print('file_path = ' + fo.file_path)
             return None
         try:
-            exif_date_name = ExifToolManager.et.get_tag(tag_name, fo.file_path)
+            exif_date_name = ExifToolManager.et.get_tag(tag_name, fo.get_exif_file_path())
         except ValueError:
             return None
         return exif_date_name
@@ -280,7 +387,7 @@ class FileManager(MyMediaRenamerBase):
         if image_number is not None:
             new_date_time_name = FileManager.get_date_time_name_from_file_object(fo)
             if new_date_time_name is None:
-                self.category_list_dict[self.previous_rename_new_date_not_found_list_label].append(fo.file_path)
+                self.category_list_dict[self.previous_rename_new_date_not_found_list_label].append(fo)
                 return True
         else:
             new_date_time_name = match[0][0]
@@ -419,6 +526,7 @@ class FileManager(MyMediaRenamerBase):
         if len(match) == 0:
             return False
         if fo.ext in self.delete_ext_list:
+            fo.is_marked_for_delete = True
             self.category_list_dict[self.gopro_delete_list_label].append(fo)
             return True
 
@@ -514,10 +622,16 @@ class FileManager(MyMediaRenamerBase):
 
     def count_total_files(self, directory):
         for root, dir_names, file_names in os.walk(directory):
-            self.total_files += len([f for f in file_names
-                                     if os.path.splitext(f)[1].replace('.', '').lower() in self.all_ext_list])
+            self.total_files += self.count_media_file_names(file_names)
+        print('Gathering info for {0} files...'.format(str(self.total_files)))
+
+    def count_total_archive_files(self, member_paths):
+        self.total_files += self.count_media_file_names([posixpath.basename(p) for p in member_paths])
         print('Gathering info for {0} files...'.format(str(self.total_files)))
 
+    def count_media_file_names(self, file_names):
+        return len([f for f in file_names if os.path.splitext(f)[1].replace('.', '').lower() in self.all_ext_list])
+
     @staticmethod
     def test_this(x):
         return x + 5
@@ -555,6 +669,190 @@ class DirectoryManager:
                 fm.process_file(FileObject(root, file_name, camera_tag))
 
 
+class ArchiveManager:
+    def __init__(self, archive_path, output_directory):
+        self.archive_path = archive_path
+        self.output_directory = output_directory
+        self.is_zip = zipfile.is_zipfile(archive_path)
+        self.archive = zipfile.ZipFile(archive_path) if self.is_zip else tarfile.open(archive_path, 'r:*')
+        self.temp_directory = tempfile.mkdtemp()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.archive.close()
+        shutil.rmtree(self.temp_directory, ignore_errors=True)
+
+    def get_members(self):
+        # (member, member path) for every regular file, in archive order
+        # for a compressed tar, getmembers() decompresses the whole archive once just to list the members
+        if self.is_zip:
+            members = [(info, info.filename) for info in self.archive.infolist() if not info.is_dir()]
+        else:
+            members = [(info, info.name) for info in self.archive.getmembers() if info.isfile()]
+        return [(member, posixpath.normpath(member_path.replace('\\', '/')).lstrip('/'))
+                for member, member_path in members]
+
+    def is_safe_member_path(self, member_path):
+        # reject absolute, drive-qualified (C:/...) and ../ member names that would land outside the output directory
+        output_directory = os.path.abspath(self.output_directory)
+        member_file_path = os.path.abspath(os.path.join(output_directory, *member_path.split('/')))
+        try:
+            return os.path.commonpath([output_directory, member_file_path]) == output_directory
+        except ValueError:
+            # different drives on Windows
+            return False
+
+    def open_member(self, member):
+        if self.is_zip:
+            return self.archive.open(member)
+        return self.archive.extractfile(member)
+
+    def get_member_timestamp(self, member):
+        # None if the archive holds no usable timestamp, e.g. a zeroed DOS date (1980, 0, 0, ...)
+        if self.is_zip:
+            try:
+                return datetime.datetime(*member.date_time).timestamp()
+            except (ValueError, OverflowError, OSError):
+                return None
+        return member.mtime
+
+    def write_header(self, member, ext, header_size):
+        header_path = os.path.join(self.temp_directory, 'header.' + ext)
+        with self.open_member(member) as src, open(header_path, 'wb') as dst:
+            dst.write(src.read(header_size))
+        return header_path
+
+    def write_tiff_header(self, member, ext):
+        # copy only the TIFF header, IFD0, the ExifIFD and the DateTimeOriginal value, each at its original offset,
+        # so exiftool can follow the offsets without the image data in between
+        header_path = os.path.join(self.temp_directory, 'header.' + ext)
+        with self.open_member(member) as src, open(header_path, 'wb') as dst:
+            header = src.read(8)
+            if len(header) < 8 or header[:2] not in (b'II', b'MM'):
+                return header_path
+            byte_order = '<' if header[:2] == b'II' else '>'
+            dst.write(header)
+            entries = ArchiveManager.copy_tiff_ifd(src, dst, byte_order, struct.unpack(byte_order + 'I', header[4:])[0])
+            if 0x8769 not in entries:
+                return header_path
+            exif_ifd_offset = struct.unpack(byte_order + 'I', entries[0x8769][2])[0]
+            entries = ArchiveManager.copy_tiff_ifd(src, dst, byte_order, exif_ifd_offset)
+            if 0x9003 in entries and entries[0x9003][1] > 4:
+                # DateTimeOriginal is a 20 byte ASCII value stored outside the IFD entry
+                value_offset = struct.unpack(byte_order + 'I', entries[0x9003][2])[0]
+                src.seek(value_offset)
+                dst.seek(value_offset)
+                dst.write(src.read(entries[0x9003][1]))
+        return header_path
+
+    @staticmethod
+    def copy_tiff_ifd(src, dst, byte_order, ifd_offset):
+        # returns {tag: (type, count, value or offset bytes)}
+        src.seek(ifd_offset)
+        entry_count_bytes = src.read(2)
+        if len(entry_count_bytes) < 2:
+            return {}
+        entry_count = struct.unpack(byte_order + 'H', entry_count_bytes)[0]
+        entries_bytes = src.read(entry_count * 12 + 4)
+        dst.seek(ifd_offset)
+        dst.write(entry_count_bytes + entries_bytes)
+        entries = {}
+        for i in range(len(entries_bytes) // 12):
+            tag, tag_type, count = struct.unpack(byte_order + 'HHI', entries_bytes[i * 12:i * 12 + 8])
+            entries[tag] = (tag_type, count, entries_bytes[i * 12 + 8:i * 12 + 12])
+        return entries
+
+    def write_png_header(self, member, ext):
+        # copy the chunks up to and including eXIf, stopping at the image data
+        header_path = os.path.join(self.temp_directory, 'header.' + ext)
+        with self.open_member(member) as src, open(header_path, 'wb') as dst:
+            dst.write(src.read(8))
+            while True:
+                chunk_header = src.read(8)
+                if len(chunk_header) < 8:
+                    break
+                chunk_size, chunk_type = struct.unpack('>I4s', chunk_header)
+                if chunk_type in (b'IDAT', b'IEND'):
+                    break
+                dst.write(chunk_header)
+                # chunk data plus its CRC
+                ArchiveManager.copy_bytes(src, dst, chunk_size + 4)
+                if chunk_type == b'eXIf':
+                    break
+            dst.write(struct.pack('>I4sI', 0, b'IEND', 0xAE426082))
+        return header_path
+
+    def write_quicktime_header(self, member, ext):
+        # copy the top-level atoms up to and including moov, which holds QuickTime:TrackCreateDate,
+        # and seek past the media data in mdat, which may come before moov
+        header_path = os.path.join(self.temp_directory, 'header.' + ext)
+        with self.open_member(member) as src, open(header_path, 'wb') as dst:
+            while True:
+                atom_header = src.read(8)
+                if len(atom_header) < 8:
+                    break
+                atom_size, atom_type = struct.unpack('>I4s', atom_header)
+                if atom_size == 1:
+                    atom_header += src.read(8)
+                    atom_size = struct.unpack('>Q', atom_header[8:])[0]
+                if atom_size == 0:
+                    # the last atom runs to the end of the file
+                    if atom_type != b'mdat':
+                        dst.write(atom_header)
+                        shutil.copyfileobj(src, dst, ArchiveFileObject.copy_buffer_size)
+                    break
+                if atom_size < len(atom_header):
+                    break
+                body_size = atom_size - len(atom_header)
+                if atom_type == b'mdat':
+                    src.seek(body_size, io.SEEK_CUR)
+                    continue
+                dst.write(atom_header)
+                ArchiveManager.copy_bytes(src, dst, body_size)
+                if atom_type == b'moov':
+                    break
+        return header_path
+
+    @staticmethod
+    def copy_bytes(src, dst, size):
+        while size > 0:
+            buffer = src.read(min(size, ArchiveFileObject.copy_buffer_size))
+            if not buffer:
+                break
+            dst.write(buffer)
+            size -= len(buffer)
+
+    @staticmethod
+    def get_camera_tag(member_dir):
+        # the deepest camera tag directory wins, so sub-directories inherit their parent's tag
+        camera_tag = None
+        for dir_name in member_dir.split('/'):
+            camera_tag = DirectoryManager.get_camera_tag(dir_name) or camera_tag
+        return camera_tag
+
+    def process_archive(self, fm: FileManager):
+        members = self.get_members()
+        fm.count_total_archive_files([member_path for member, member_path in members])
+        # members are processed in archive order, so a compressed tar is decompressed once more from the start
+        # instead of rewinding for every member
+        for member_index, (member, member_path) in enumerate(members):
+            member_dir, file_name = posixpath.split(member_path)
+            camera_tag = ArchiveManager.get_camera_tag(member_dir)
+            fo = ArchiveFileObject(self, member, member_index, member_path, camera_tag)
+            if not self.is_safe_member_path(member_path):
+                fm.category_list_dict[fm.archive_unsafe_path_list_label].append(fo)
+                continue
+            if camera_tag is None or file_name.lower() == 'thumbs.db':
+                fm.category_list_dict[fm.archive_skipped_list_label].append(fo)
+                continue
+            fm.process_file(fo)
+            # nothing is on disk yet, so members that are not renamed are written out under their original name
+            if fo.new_file_name == '' and not fo.is_marked_for_delete:
+                fm.set_new_file_name(fo, fo.file_name)
+
+
 class ResultsManager():
     def __init__(self, fm: FileManager):
         self.fm = fm
@@ -583,12 +881,28 @@ class ResultsManager():
                                                    'Files',
                                                    '-' * 5))
             for fo in self.fm.category_list_dict[category]:
-                if print_format is None:
+                # archive files written out under a different name still show where they go
+                if print_format is None and fo.new_file_name in ('', fo.file_name):
                     print('{0}{1}'.format(' ' * 24, fo.file_name))
+                elif print_format is None:
+                    print('{0}{1}{2}'.format(fo.file_name.rjust(36, ' '), '  ->  ', fo.new_file_name))
                 else:
                     print(str(print_format).format(fo.file_name.rjust(36, ' '), '  ->  ', fo.new_file_name))
 
+    def get_rename_list(self):
+        if ArgsManager.archive != '':
+            # write members in archive order, so a compressed tar is decompressed a third time from the start
+            # instead of rewinding for every member
+            rename_list = [fo for category in self.fm.category_list
+                           for fo in self.fm.category_list_dict[category] if fo.new_file_name != '']
+            return sorted(rename_list, key=lambda fo: fo.member_index)
+        return [fo for category in self.fm.category_list if not category.endswith('-')
+                for fo in self.fm.category_list_dict[category]]
+
     def rename(self, ):
+        rename_list = self.get_rename_list()
+        if ArgsManager.archive != '':
+            self.prompt_for_rename = len(rename_list) > 0
         if self.prompt_for_rename is False:
             print('Nothing to rename!')
             print()
@@ -596,20 +910,29 @@ class ResultsManager():
             print('        See config.py for camera tag names')
 
             return
+        if ArgsManager.archive != '':
+            self.print_category(self.fm.gopro_delete_list_label)
+            print()
+            print('Files that are not renamed are written out under their original names.')
+            print('Files in the {0}, {1} and {2} are not written out.'.format(
+                self.fm.archive_skipped_list_label.replace('-', ''),
+                self.fm.archive_unsafe_path_list_label.replace('-', ''),
+                self.fm.gopro_delete_list_label))
         inpt = input('Rename these?... Hit y to rename, or any other key to abort:')
         print()
         if inpt != 'y':
             print('Rename aborted.')
         else:
-            for category in self.fm.category_list:
-                if category.endswith('-'):
-                    continue
-                if len(self.fm.category_list_dict[category]) > 0:
-                    for fo in self.fm.category_list_dict[category]:
-                        fo.rename()
-            print('Rename completed.')
+            failed_count = len([fo for fo in rename_list if not fo.rename()])
+            if failed_count > 0:
+                print('Rename completed with {0} failures.'.format(str(failed_count)))
+            else:
+                print('Rename completed.')
 
     def delete(self):
+        # archive files in the delete list are simply never written out
+        if ArgsManager.archive != '':
+            return
         if len(self.fm.category_list_dict[self.fm.gopro_delete_list_label]) > 0:
             self.print_category(self.fm.gopro_delete_list_label)
             print()
@@ -623,19 +946,29 @@ class ResultsManager():
                 print('Delete completed.')
 
 
+def process_results(fm: FileManager):
+    results_manager = ResultsManager(fm)
+    results_manager.print_results()
+    results_manager.rename()
+    results_manager.delete()
+
+
 def main():
     try:
         ArgsManager.parse_args()
 
         # collect_files()
         file_manager = FileManager()
+        if ArgsManager.archive != '':
+            with ArchiveManager(ArgsManager.archive, ArgsManager.output) as archive_manager:
+                with ExifToolManager.get_et():
+                    archive_manager.process_archive(file_manager)
+                process_results(file_manager)
+            return
+
         with ExifToolManager.get_et():
             DirectoryManager().process_directory(ArgsManager.directory, file_manager)
-
-        results_manager = ResultsManager(file_manager)
-        results_manager.print_results()
-        results_manager.rename()
-        results_manager.delete()
+        process_results(file_manager)
 
     except Exception:
         sys.exit(1)